@@ -65,6 +65,12 @@ def audio_samples_from_file(file: BinaryIO) -> NDArray[np.float32]:
     return audio  # pyright: ignore[reportReturnType]
 
 
+# NOTE: equivalent to `audio_samples_from_file` for RAW PCM 16-bit little-endian data, but avoids the per-call overhead of opening a virtual file with libsndfile. Meant for the many small chunks received in realtime sessions
+def audio_samples_from_pcm16_bytes(audio_bytes: bytes) -> NDArray[np.float32]:
+    audio_data = np.frombuffer(audio_bytes, dtype="<i2", count=len(audio_bytes) // 2)
+    return audio_data.astype(np.float32) / 32768.0
+
+
 class Audio:
     def __init__(
         self,
@@ -46,6 +46,17 @@ class OrtOptions(BaseModel):
     Dictionary of ORT provider options. The keys are provider names, and the values are dictionaries of options.
     Example: {"CUDAExecutionProvider": {"cudnn_conv_algo_search": "DEFAULT"}}
     """
+    intra_op_num_threads: int = Field(default=0, ge=0)
+    """
+    Number of threads used to parallelize the execution within nodes. 0 lets ONNX Runtime decide (one thread per physical core).
+    NOTE: currently only applied to speaker embedding (pyannote) models.
+    """
+    quantize_speaker_embedding_models: bool = False
+    """
+    Whether to run speaker embedding (pyannote) models with int8 weights. The quantized model is created from the original one the first time it's loaded and stored next to it.
+    Faster on CPUs (especially ones with VNNI support), but the returned embeddings differ slightly from the ones produced by the original model. The integer kernels are CPU only, so this shouldn't be enabled when running on a GPU.
+    Requires the `quantization` extra (`onnx` package) to be installed.
+    """
 
 
 # TODO: document `alias` behaviour within the docstring
@@ -11,6 +11,8 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from onnxruntime import SessionOptions  # pyright: ignore[reportAttributeAccessIssue]
+
     from speaches.config import OrtOptions
 
 logger = logging.getLogger(__name__)
@@ -39,6 +41,19 @@ def get_ort_providers_with_options(ort_opts: OrtOptions) -> list[tuple[str, dict
     return available_providers_with_opts
 
 
+def get_ort_session_options(ort_opts: OrtOptions) -> SessionOptions:
+    from onnxruntime import ExecutionMode, GraphOptimizationLevel, SessionOptions  # pyright: ignore[reportAttributeAccessIssue]
+
+    sess_options = SessionOptions()
+    sess_options.graph_optimization_level = GraphOptimizationLevel.ORT_ENABLE_ALL
+    sess_options.execution_mode = ExecutionMode.ORT_SEQUENTIAL
+    sess_options.enable_mem_pattern = True
+    sess_options.intra_op_num_threads = ort_opts.intra_op_num_threads
+    # NOTE: with sequential execution there's no parallelism between nodes to exploit
+    sess_options.inter_op_num_threads = 1
+    return sess_options
+
+
 class SelfDisposingModel[T]:
     def __init__(
         self,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from contextlib import asynccontextmanager
 import logging
 import os
@@ -9,6 +10,8 @@ import uuid
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
 
+    from speaches.executors.shared.executor import Executor
+
 from fastapi import (
     FastAPI,
     HTTPException,
@@ -79,11 +82,28 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     logger = logging.getLogger(__name__)
     logger.info("Downloading default models on startup...")
     executor_registry = get_executor_registry()
-    for model_id in DEFAULT_MODELS:
-        for executor in executor_registry.all_executors():
-            if model_id in [model.id for model in executor.model_registry.list_remote_models()]:
+    executors = executor_registry.all_executors()
+
+    # NOTE: listing remote models and downloading them is I/O bound, so each executor is queried once and the default models are downloaded concurrently
+    # NOTE: a failure to list the models of one executor (most often a network error) shouldn't prevent the server from starting
+    def list_remote_model_ids(executor: Executor) -> set[str]:
+        try:
+            return {model.id for model in executor.model_registry.list_remote_models()}
+        except Exception:
+            logger.exception(f"Failed to list remote models for the '{executor.name}' executor")
+            return set()
+
+    remote_model_ids = await asyncio.gather(
+        *(asyncio.to_thread(list_remote_model_ids, executor) for executor in executors)
+    )
+
+    async def download_default_model(model_id: str) -> None:
+        for executor, executor_model_ids in zip(executors, remote_model_ids, strict=True):
+            if model_id in executor_model_ids:
                 try:
-                    was_downloaded = executor.model_registry.download_model_files_if_not_exist(model_id)
+                    was_downloaded = await asyncio.to_thread(
+                        executor.model_registry.download_model_files_if_not_exist, model_id
+                    )
                     if was_downloaded:
                         logger.info(f"Downloaded default model: {model_id}")
                     else:
@@ -91,6 +111,8 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
                     break
                 except Exception:
                     logger.exception(f"Failed to download default model: {model_id}")
+
+    await asyncio.gather(*(download_default_model(model_id) for model_id in DEFAULT_MODELS))
     logger.info("Startup complete")
     yield
     logger.info("Shutting down...")
@@ -1,8 +1,8 @@
 from functools import lru_cache
-import json
 from pathlib import Path
 from typing import Annotated
 
+import orjson
 from pydantic import BeforeValidator, Field
 
 MODEL_ID_ALIASES_PATH = Path("model_aliases.json")  # TODO: make configurable
@@ -10,7 +10,7 @@ MODEL_ID_ALIASES_PATH = Path("model_aliases.json")  # TODO: make configurable
 
 @lru_cache
 def load_model_id_aliases() -> dict[str, str]:
-    return json.loads(MODEL_ID_ALIASES_PATH.read_text())
+    return orjson.loads(MODEL_ID_ALIASES_PATH.read_bytes())
 
 
 def resolve_model_id_alias(model_id: str) -> str:
@@ -1,23 +1,22 @@
 import logging
 
 from openai.types.chat import (
-    ChatCompletionAssistantMessageParam,
     ChatCompletionAudioParam,
     ChatCompletionMessageParam,
     ChatCompletionMessageToolCallParam,
     ChatCompletionStreamOptionsParam,
     ChatCompletionSystemMessageParam,
-    ChatCompletionToolMessageParam,
-    ChatCompletionToolParam,
-    ChatCompletionUserMessageParam,
 )
-from openai.types.chat.chat_completion_message_tool_call_param import Function
 from openai.types.chat.completion_create_params import (
     CompletionCreateParamsStreaming,
 )
-from openai.types.shared_params.function_definition import FunctionDefinition
 
-from speaches.types.realtime import ConversationItem, Response
+from speaches.types.realtime import (
+    ConversationItem,
+    ConversationItemFunctionCallOutput,
+    ConversationItemMessage,
+    Response,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -34,13 +33,11 @@ def create_completion_params(
         # openai.BadRequestError: Error code: 400 - {'error': {'message': "Invalid 'tools': empty array. Expected an array with minimum length 1, but got an empty array instead.", 'type': 'invalid_request_error', 'param': 'tools', 'code': 'empty_array'}}
         # TODO: I might be able to get away with not doing any conversion here, but I'm not sure. Test it out.
         kwargs["tools"] = [
-            ChatCompletionToolParam(
-                type=tool.type,
+            {
+                "type": tool.type,
                 # HACK: figure out why `tool.description` is nullable
-                function=FunctionDefinition(
-                    name=tool.name, description=tool.description or "", parameters=tool.parameters
-                ),
-            )
+                "function": {"name": tool.name, "description": tool.description or "", "parameters": tool.parameters},
+            }
             for tool in response.tools
         ]
         kwargs["tool_choice"] = response.tool_choice
@@ -67,46 +64,54 @@ def create_completion_params(
     )
 
 
-def conversation_item_to_chat_message(  # noqa: PLR0911
+# NOTE: the `*Param` types are `TypedDict`s, so the messages are built as plain dict literals instead of calling the `TypedDict` classes
+def message_item_to_chat_message(item: ConversationItemMessage) -> ChatCompletionMessageParam | None:  # noqa: PLR0911
+    content_list = item.content
+    assert content_list is not None and len(content_list) == 1, item
+    content = content_list[0]
+    if item.status != "completed":
+        logger.warning(f"Item {item} is not completed. Skipping.")
+        return None
+    match content.type:
+        case "text":
+            text = content.text
+            assert text, content
+            return {"role": "assistant", "content": text}
+        case "audio":
+            transcript = content.transcript
+            assert transcript, content
+            return {"role": "assistant", "content": transcript}
+        case "input_text":
+            text = content.text
+            assert text, content
+            return {"role": "user", "content": text}
+        case "input_audio":
+            transcript = content.transcript
+            if not transcript:
+                logger.error(f"Conversation item doesn't have a non-empty transcript: {item}")
+                return None
+            return {"role": "user", "content": transcript}
+    return None
+
+
+def function_call_output_item_to_chat_message(item: ConversationItemFunctionCallOutput) -> ChatCompletionMessageParam:
+    call_id, output = item.call_id, item.output
+    assert call_id and output, item
+    return {"role": "tool", "tool_call_id": call_id, "content": output}
+
+
+def conversation_item_to_chat_message(
     item: ConversationItem,
 ) -> ChatCompletionMessageParam | None:
     """Convert a single conversation item to a chat message.
 
     NOTE: function_call items are NOT handled here - they're grouped in items_to_chat_messages.
     """
-    match item.type:
-        case "message":
-            content_list = item.content
-            assert content_list is not None and len(content_list) == 1, item
-            content = content_list[0]
-            if item.status != "completed":
-                logger.warning(f"Item {item} is not completed. Skipping.")
-                return None
-            match content.type:
-                case "text":
-                    assert content.text, content
-                    return ChatCompletionAssistantMessageParam(role="assistant", content=content.text)
-                case "audio":
-                    assert content.transcript, content
-                    return ChatCompletionAssistantMessageParam(role="assistant", content=content.transcript)
-                case "input_text":
-                    assert content.text, content
-                    return ChatCompletionUserMessageParam(role="user", content=content.text)
-                case "input_audio":
-                    if not content.transcript:
-                        logger.error(f"Conversation item doesn't have a non-empty transcript: {item}")
-                        return None
-                    return ChatCompletionUserMessageParam(role="user", content=content.transcript)
-        case "function_call":
-            # function_call items are handled in items_to_chat_messages to support grouping
-            return None
-        case "function_call_output":
-            assert item.call_id and item.output, item
-            return ChatCompletionToolMessageParam(
-                role="tool",
-                tool_call_id=item.call_id,
-                content=item.output,
-            )
+    if item.type == "message":
+        return message_item_to_chat_message(item)
+    elif item.type == "function_call_output":
+        return function_call_output_item_to_chat_message(item)
+    return None
 
 
 def items_to_chat_messages(items: list[ConversationItem]) -> list[ChatCompletionMessageParam]:
@@ -119,30 +124,24 @@ def items_to_chat_messages(items: list[ConversationItem]) -> list[ChatCompletion
     pending_tool_calls: list[ChatCompletionMessageToolCallParam] = []
 
     for item in items:
+        # NOTE: `item.type` is compared directly (rather than through a local) so that pyright narrows `item`
         # If this is a function_call, accumulate it
         if item.type == "function_call":
-            assert item.call_id and item.name and item.arguments and item.status == "completed", item
+            call_id, name, arguments = item.call_id, item.name, item.arguments
+            assert call_id and name and arguments and item.status == "completed", item
             pending_tool_calls.append(
-                ChatCompletionMessageToolCallParam(
-                    id=item.call_id,
-                    type="function",
-                    function=Function(
-                        name=item.name,
-                        arguments=item.arguments,
-                    ),
-                )
+                {
+                    "id": call_id,
+                    "type": "function",
+                    "function": {"name": name, "arguments": arguments},
+                }
             )
             continue
 
-        # If we hit a non-function_call item, flush any pending tool calls first
+        # If we hit a non-function_call item, flush any pending tool calls first. The list is handed over to the message as-is and a fresh one is started, so no copy is needed
         if pending_tool_calls:
-            messages.append(
-                ChatCompletionAssistantMessageParam(
-                    role="assistant",
-                    tool_calls=pending_tool_calls.copy(),
-                )
-            )
-            pending_tool_calls.clear()
+            messages.append({"role": "assistant", "tool_calls": pending_tool_calls})
+            pending_tool_calls = []
 
         # Convert the current item
         chat_message = conversation_item_to_chat_message(item)
@@ -151,11 +150,6 @@ def items_to_chat_messages(items: list[ConversationItem]) -> list[ChatCompletion
 
     # Flush any remaining pending tool calls
     if pending_tool_calls:
-        messages.append(
-            ChatCompletionAssistantMessageParam(
-                role="assistant",
-                tool_calls=pending_tool_calls.copy(),
-            )
-        )
+        messages.append({"role": "assistant", "tool_calls": pending_tool_calls})
 
     return messages
@@ -17,6 +17,8 @@ logger = logging.getLogger(__name__)
 class EventRouter:
     def __init__(self) -> None:
         self.event_handlers: dict[str, Callable] = {}
+        # NOTE: whether a handler is a coroutine function is determined once at registration rather than on every dispatch
+        self.async_event_types: set[str] = set()
 
     def register(self, event_type: str) -> Callable:
         """Decorator to register an event handler for a specific event."""
@@ -27,19 +29,21 @@ class EventRouter:
 
             # Register the handler for the event
             self.event_handlers[event_type] = func
+            if asyncio.iscoroutinefunction(func):
+                self.async_event_types.add(event_type)
             return func
 
         return decorator
 
     async def dispatch(self, ctx: SessionContext, event: Event) -> None:
-        if event.type not in self.event_handlers:
-            if event.type in CLIENT_EVENT_TYPES:
-                logger.error(f"No handler registered for event: '{event.type}'")
+        event_type = event.type
+        handler = self.event_handlers.get(event_type)
+        if handler is None:
+            if event_type in CLIENT_EVENT_TYPES:
+                logger.error(f"No handler registered for event: '{event_type}'")
             return
 
-        handler = self.event_handlers[event.type]
-
-        if asyncio.iscoroutinefunction(handler):
+        if event_type in self.async_event_types:
             await handler(ctx, event)
         else:
             handler(ctx, event)
@@ -50,3 +54,5 @@ class EventRouter:
                 raise ValueError(f"Conflict: An event handler for '{event_type}' is already registered.")
 
             self.event_handlers[event_type] = handler
+            if event_type in other_router.async_event_types:
+                self.async_event_types.add(event_type)
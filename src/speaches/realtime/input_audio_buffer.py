@@ -48,28 +48,41 @@ class VadState(BaseModel):
 class InputAudioBuffer:
     def __init__(self, pubsub: EventPubSub) -> None:
         self.id = generate_item_id()
-        self.data: NDArray[np.float32] = np.array([], dtype=np.float32)
+        # NOTE: `np.append` copies the whole buffer on every call, making appends quadratic in the length of the audio. Instead, the backing array grows geometrically and only `self._size` samples of it are in use
+        self._buffer: NDArray[np.float32] = np.empty(0, dtype=np.float32)
+        self._size = 0
         self.vad_state = VadState()
         self.pubsub = pubsub
 
+    @property
+    def data(self) -> NDArray[np.float32]:
+        return self._buffer[: self._size]
+
     @property
     def size(self) -> int:
         """Number of samples in the buffer."""
-        return len(self.data)
+        return self._size
 
     @property
     def duration(self) -> float:
         """Duration of the audio in seconds."""
-        return len(self.data) / SAMPLE_RATE
+        return self._size / SAMPLE_RATE
 
     @property
     def duration_ms(self) -> int:
         """Duration of the audio in milliseconds."""
-        return len(self.data) // MS_SAMPLE_RATE
+        return self._size // MS_SAMPLE_RATE
 
     def append(self, audio_chunk: NDArray[np.float32]) -> None:
         """Append an audio chunk to the buffer."""
-        self.data = np.append(self.data, audio_chunk)
+        new_size = self._size + len(audio_chunk)
+        if new_size > len(self._buffer):
+            buffer = np.empty(max(new_size, 2 * len(self._buffer)), dtype=np.float32)
+            buffer[: self._size] = self._buffer[: self._size]
+            self._buffer = buffer
+        # NOTE: previously returned `data` views stay valid since samples that have been written are never overwritten
+        self._buffer[self._size : new_size] = audio_chunk
+        self._size = new_size
 
     # def commit(self) -> None:
     #     """Publish an event to indicate that the buffer is ready for processing."""
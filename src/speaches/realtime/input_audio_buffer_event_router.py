@@ -1,5 +1,4 @@
 import base64
-from io import BytesIO
 import logging
 from typing import Literal
 
@@ -10,7 +9,7 @@ from numpy.typing import NDArray
 import openai
 from openai.types.beta.realtime.error_event import Error
 
-from speaches.audio import audio_samples_from_file
+from speaches.audio import audio_samples_from_pcm16_bytes
 from speaches.realtime.context import SessionContext
 from speaches.realtime.event_router import EventRouter
 from speaches.realtime.input_audio_buffer import (
@@ -123,7 +122,7 @@ def vad_detection_flow(
 
 @event_router.register("input_audio_buffer.append")
 def handle_input_audio_buffer_append(ctx: SessionContext, event: InputAudioBufferAppendEvent) -> None:
-    audio_chunk = audio_samples_from_file(BytesIO(base64.b64decode(event.audio)))
+    audio_chunk = audio_samples_from_pcm16_bytes(base64.b64decode(event.audio))
     # convert the audio data from 24kHz (sample rate defined in the API spec) to 16kHz (sample rate used by the VAD and for transcription)
     audio_chunk = resample_audio_data(audio_chunk, 24000, 16000)
     input_audio_buffer_id = next(reversed(ctx.input_audio_buffers))
@@ -203,4 +202,4 @@ async def handle_input_audio_buffer_committed(ctx: SessionContext, event: InputA
                 message=e.message,
             )
         )
-    await transcriber.task
\ No newline at end of file
+    await transcriber.task
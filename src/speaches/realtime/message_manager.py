@@ -1,13 +1,16 @@
 import abc
 import asyncio
-import json
+import base64
 import logging
 from pathlib import Path
+import re
+import struct
 from typing import Any
 
 import fastapi
 import httpx_ws
 from openai.types.beta.realtime.error_event import Error
+import orjson
 from pydantic import ValidationError
 
 from speaches.realtime.pubsub import EventPubSub
@@ -17,12 +20,64 @@ from speaches.types.realtime import (
     SERVER_EVENT_TYPES,
     ErrorEvent,
     Event,
+    ResponseAudioDeltaEvent,
     client_event_type_adapter,
     server_event_type_adapter,
 )
 
 logger = logging.getLogger(__name__)
 
+MAX_MERGED_AUDIO_DELTAS = 128
+# little-endian uint32 holding the length of the JSON header that precedes the raw PCM payload
+BINARY_AUDIO_DELTA_HEADER_LENGTH_FORMAT = "<I"
+# matches anything that would need escaping (or isn't ASCII) inside of a JSON string
+JSON_UNSAFE_CHARS_PATTERN = re.compile(r'[^\x20-\x7e]|["\\]')
+# matches anything outside of the standard base64 alphabet (e.g. the newlines of line-wrapped base64)
+BASE64_UNSAFE_CHARS_PATTERN = re.compile(r"[^A-Za-z0-9+/=]")
+
+
+def merge_audio_deltas(deltas: list[str]) -> str:
+    # base64 strings can be concatenated as-is as long as none but the last one is padded
+    if not any(delta.endswith("=") for delta in deltas[:-1]):
+        return "".join(deltas)
+    return base64.b64encode(b"".join(base64.b64decode(delta) for delta in deltas)).decode("utf-8")
+
+
+# NOTE: hand-written equivalent of `event.model_dump_json()` for the most frequently sent event. Falls back to pydantic if any of the string fields would need escaping
+def serialize_audio_delta(event: ResponseAudioDeltaEvent) -> str:
+    # NOTE: the delta is produced by `base64.b64encode` (see `routers/chat.py`), so it's checked against the (JSON safe) base64 alphabet rather than for every character that would need escaping
+    delta = event.delta
+    if BASE64_UNSAFE_CHARS_PATTERN.search(delta) is not None or any(
+        JSON_UNSAFE_CHARS_PATTERN.search(value) is not None
+        for value in (event.event_id, event.item_id, event.response_id)
+    ):
+        return event.model_dump_json()
+    return (
+        f'{{"content_index":{event.content_index},"delta":"{delta}","event_id":"{event.event_id}",'
+        f'"item_id":"{event.item_id}","output_index":{event.output_index},"response_id":"{event.response_id}",'
+        f'"type":"{event.type}"}}'
+    )
+
+
+# NOTE: merges audio deltas of the same item that are already waiting in the queue into a single event. Returns the merged event and the first queued event that couldn't be merged (if any). The merged event keeps the first event's `event_id`, the ids of the other merged events never reach the client
+def coalesce_audio_deltas(
+    event: ResponseAudioDeltaEvent, q: asyncio.Queue[Event]
+) -> tuple[ResponseAudioDeltaEvent, Event | None]:
+    deltas = [event.delta]
+    next_event: Event | None = None
+    while len(deltas) < MAX_MERGED_AUDIO_DELTAS and not q.empty():
+        queued_event = q.get_nowait()
+        if isinstance(queued_event, ResponseAudioDeltaEvent) and queued_event.item_id == event.item_id:
+            deltas.append(queued_event.delta)
+        else:
+            next_event = queued_event
+            break
+    if len(deltas) > 1:
+        # NOTE: events are shared between subscribers, so a copy is made instead of mutating the original
+        event = event.model_copy(update={"delta": merge_audio_deltas(deltas)})
+        logger.debug(f"Merged {len(deltas)} audio deltas")
+    return event, next_event
+
 
 class BaseMessageManager(abc.ABC):
     def __init__(self, event_pubsub: EventPubSub | None = None) -> None:
@@ -59,9 +114,9 @@ class BaseMessageManager(abc.ABC):
 
     # HACK: for debugging purposes
     def dump_to_file(self, session_id: str) -> None:
-        with Path(f"sessions/{session_id}.json").open("w") as f:
+        with Path(f"sessions/{session_id}.json").open("wb") as f:
             print("Dumping events to file", session_id)
-            f.write(json.dumps([m.model_dump() for m in self.event_pubsub.events], indent=2))
+            f.write(orjson.dumps([m.model_dump() for m in self.event_pubsub.events], option=orjson.OPT_INDENT_2))
 
 
 class WsClientMessageManager(BaseMessageManager):
@@ -103,16 +158,28 @@ class WsClientMessageManager(BaseMessageManager):
             self.event_pubsub.subscribers.remove(q)
 
 
+def encode_binary_audio_delta(event: ResponseAudioDeltaEvent) -> bytes:
+    header = event.model_dump_json(exclude={"delta"}).encode("utf-8")
+    return struct.pack(BINARY_AUDIO_DELTA_HEADER_LENGTH_FORMAT, len(header)) + header + base64.b64decode(event.delta)
+
+
 class WsServerMessageManager(BaseMessageManager):
+    def __init__(self, event_pubsub: EventPubSub | None = None, *, binary_audio_deltas: bool = False) -> None:
+        super().__init__(event_pubsub)
+        # NOTE: when enabled, `response.audio.delta` events are sent as binary frames (see `encode_binary_audio_delta`) instead of JSON with base64 encoded audio. This deviates from the OpenAI Realtime API
+        self.binary_audio_deltas = binary_audio_deltas
+
     async def receiver(self, ws: fastapi.WebSocket) -> None:
         logger.info("Receiver task started")
         while True:
-            try:
-                # logger.debug("Waiting for event")
-                data = await ws.receive_text()
-            except fastapi.WebSocketDisconnect:
+            # logger.debug("Waiting for event")
+            message = await ws.receive()
+            if message["type"] == "websocket.disconnect":
                 logger.info("Failed to receive message due to disconnect")
                 break
+            # NOTE: the raw frame is handed to pydantic as-is so binary frames skip the decode-to-str step
+            # NOTE: `is not None` rather than truthiness, as an empty binary frame has no "text" key
+            data = message["bytes"] if message.get("bytes") is not None else message["text"]
             try:
                 event = client_event_type_adapter.validate_json(data)
             except ValidationError as e:
@@ -128,16 +195,29 @@ class WsServerMessageManager(BaseMessageManager):
     async def sender(self, ws: fastapi.WebSocket) -> None:
         logger.info("Sender task started")
         q = self.event_pubsub.subscribe()
+        next_event: Event | None = None
         try:
             while True:
                 # logger.debug("Waiting for event")
-                event = await q.get()
+                if next_event is not None:
+                    event, next_event = next_event, None
+                else:
+                    event = await q.get()
                 if event.type not in SERVER_EVENT_TYPES:
                     continue
+                # NOTE: audio deltas tend to pile up while a previous send is in progress. Sending them as a single event cuts down the number of frames
+                if isinstance(event, ResponseAudioDeltaEvent):
+                    event, next_event = coalesce_audio_deltas(event, q)
                 server_event = server_event_type_adapter.validate_python(event)
                 try:
                     logger.debug(f"Sending {event.type} event")
-                    await ws.send_text(server_event.model_dump_json())
+                    if isinstance(server_event, ResponseAudioDeltaEvent):
+                        if self.binary_audio_deltas:
+                            await ws.send_bytes(encode_binary_audio_delta(server_event))
+                        else:
+                            await ws.send_text(serialize_audio_delta(server_event))
+                    else:
+                        await ws.send_text(server_event.model_dump_json())
                     logger.info(f"Sent {event.type} event")
                 except fastapi.WebSocketDisconnect:
                     logger.info("Failed to send message due to disconnect")
@@ -1,9 +1,9 @@
 from asyncio import Queue
 from collections.abc import AsyncGenerator
-import json
 import logging
 from pathlib import Path
 
+import orjson
 from pydantic import BaseModel
 
 from speaches.types.realtime import CLIENT_EVENT_TYPES, SERVER_EVENT_TYPES, Event
@@ -59,8 +59,8 @@ class EventPubSub(PubSub[Event]):
             logger.info(f"Subscriber for event type {event_type} removed")
 
     def dump_to_file(self, file_path: Path) -> None:
-        with file_path.open("w") as f:
-            f.write(json.dumps([event.model_dump() for event in self.events], indent=2))
+        with file_path.open("wb") as f:
+            f.write(orjson.dumps([event.model_dump() for event in self.events], option=orjson.OPT_INDENT_2))
 
 
 # TODO: log delay between when message is added and the subscriber is notified
@@ -284,7 +284,8 @@ async def handle_response_create_event(ctx: SessionContext, event: ResponseCreat
         if event.response.metadata is not None:
             ctx.pubsub.publish_nowait(unsupported_field_error("response.metadata"))
 
-        configuration_dict = configuration.model_dump()
+        # NOTE: `input` holds the whole conversation history. It's excluded so that the items aren't serialized and re-validated on every response
+        configuration_dict = configuration.model_dump(exclude={"input"})
         configuration_update_dict = event.response.model_dump(
             exclude_none=True, exclude={"conversation", "input", "output_audio_format", "metadata"}
         )
@@ -292,7 +293,7 @@ async def handle_response_create_event(ctx: SessionContext, event: ResponseCreat
         logger.debug(f"Response configuration before update: {configuration_dict}")
         updated_configuration = update_dict(configuration_dict, configuration_update_dict)
         logger.debug(f"Response configuration after update: {updated_configuration}")
-        configuration = Response(**updated_configuration)
+        configuration = Response(**updated_configuration, input=configuration.input)
 
     ctx.response = ResponseHandler(
         completion_client=ctx.completion_client,
@@ -1,6 +1,5 @@
 import asyncio
 import base64
-import io
 import logging
 
 from aiortc import MediaStreamTrack
@@ -8,7 +7,7 @@ from av.audio.frame import AudioFrame
 import numpy as np
 from openai.types.beta.realtime import ResponseAudioDeltaEvent
 
-from speaches.audio import audio_samples_from_file
+from speaches.audio import audio_samples_from_pcm16_bytes
 from speaches.realtime.context import SessionContext
 from speaches.realtime.input_audio_buffer_event_router import resample_audio_data
 
@@ -58,7 +57,7 @@ class AudioStreamTrack(MediaStreamTrack):
                     return
 
                 # copied from `input_audio_buffer.append` handler
-                audio_array = audio_samples_from_file(io.BytesIO(base64.b64decode(event.delta)))
+                audio_array = audio_samples_from_pcm16_bytes(base64.b64decode(event.delta))
                 audio_array = resample_audio_data(audio_array, 24000, 48000)
 
                 # Convert to int16 if not already
@@ -131,10 +131,11 @@ async def rtc_datachannel_sender(ctx: SessionContext, channel: RTCDataChannel) -
             event = await q.get()
             if event.type not in SERVER_EVENT_TYPES:
                 continue
-            server_event = server_event_type_adapter.validate_python(event)
-            if server_event.type == "response.audio.delta":
+            # NOTE: checked before validation so the large base64 `delta` payload is never touched
+            if event.type == "response.audio.delta":
                 logger.debug("Skipping response.audio.delta event")
                 continue
+            server_event = server_event_type_adapter.validate_python(event)
 
             # Get JSON representation of the event
             message = server_event.model_dump_json()
@@ -168,8 +169,8 @@ def message_handler(ctx: SessionContext, message: str) -> None:
 
 
 async def audio_receiver(ctx: SessionContext, track: RemoteStreamTrack) -> None:
-    # Initialize buffer to store audio data
-    buffer = np.array([], dtype=np.int16)
+    # Initialize buffer to store audio data (PCM16 bytes)
+    buffer = bytearray()
 
     while True:
         frames = await track.recv()
@@ -185,21 +186,19 @@ async def audio_receiver(ctx: SessionContext, track: RemoteStreamTrack) -> None:
         # Accumulate audio data
         for frame in frames:
             arr = frame.to_ndarray()
-            buffer = np.append(buffer, arr.flatten())  # Flatten and append to buffer
+            assert arr.dtype == np.int16, "Audio sample width is not 2 bytes"
+            buffer += arr.tobytes()  # Append to buffer (`tobytes` flattens)
 
-            # When buffer reaches or exceeds target size, emit event
-            if len(buffer) >= MIN_BUFFER_SIZE:
-                # Convert to bytes and emit event
-                audio_bytes = buffer.tobytes()
-                assert len(audio_bytes) == len(buffer) * 2, "Audio sample width is not 2 bytes"
+            # When buffer reaches or exceeds target size (2 bytes per sample), emit event
+            if len(buffer) >= MIN_BUFFER_SIZE * 2:
                 ctx.pubsub.publish_nowait(
                     InputAudioBufferAppendEvent(
                         type="input_audio_buffer.append",
-                        audio=base64.b64encode(audio_bytes).decode(),
+                        audio=base64.b64encode(buffer).decode(),
                     )
                 )
 
-                buffer = np.array([], dtype=np.int16)
+                buffer.clear()
 
 
 def datachannel_handler(ctx: SessionContext, channel: RTCDataChannel) -> None:
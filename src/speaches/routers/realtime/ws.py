@@ -61,6 +61,7 @@ async def realtime(
     intent: str = "conversation",
     language: str | None = None,
     transcription_model: str | None = None,
+    binary_audio: bool = False,
 ) -> None:
     """OpenAI Realtime API compatible WebSocket endpoint.
 
@@ -68,6 +69,7 @@ async def realtime(
     - 'model' parameter is the conversation model (e.g., gpt-4o-realtime-preview)
     - 'transcription_model' parameter is for input_audio_transcription.model
     - 'intent' parameter controls session behavior (conversation vs transcription)
+    - 'binary_audio' parameter (not part of the OpenAI spec) makes the server send `response.audio.delta` events as binary frames: a little-endian uint32 header length, the JSON event without the `delta` field, then the raw PCM16 audio
 
     References:
     - https://platform.openai.com/docs/guides/realtime/overview
@@ -94,7 +96,7 @@ async def realtime(
         completion_client=completion_client,
         session=create_session_object_configuration(model, intent, language, transcription_model),
     )
-    message_manager = WsServerMessageManager(ctx.pubsub)
+    message_manager = WsServerMessageManager(ctx.pubsub, binary_audio_deltas=binary_audio)
     async with asyncio.TaskGroup() as tg:
         event_listener_task = tg.create_task(event_listener(ctx), name="event_listener")
         async with asyncio.timeout(OPENAI_REALTIME_SESSION_DURATION_SECONDS):
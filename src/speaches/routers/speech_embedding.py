@@ -36,11 +36,12 @@ def create_speech_embedding(
     executor = find_executor_for_model_or_raise(model, model_card_data, executor_registry.speaker_embedding)
 
     with executor.model_manager.load_model(model) as inference_session:
-        audio_input = audio.astype(np.float32)
+        # NOTE: unlike `astype`, this doesn't copy the decoded audio when it's already a contiguous float32 array
+        audio_input = np.ascontiguousarray(audio, dtype=np.float32)
         if len(audio_input.shape) == 1:
             audio_input = audio_input.reshape(1, -1)
 
-        outputs = inference_session.run(None, {"waveform": audio_input})  # TODO: handle other input name possibilities
+        outputs = inference_session.run(None, {inference_session.get_inputs()[0].name: audio_input})
         embedding = outputs[0][0].tolist()
 
         return CreateEmbeddingResponse(